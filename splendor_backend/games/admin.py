@@ -1,38 +1,215 @@
+import json
+import uuid
+
 from django.contrib import admin
-from .models import Game, Player, Card, Noble, GameLog
+from django.contrib.admin.views.main import PAGE_VAR
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.urls import reverse
+from django.utils.functional import cached_property
+from django.utils.html import format_html, format_html_join
+
+from .models import Game, Player, Card, Noble, GameLog, PlayerStats
 # Register your models here.
 
+# 数据库 bigint 上限，超出的数字不能作为整数主键/外键查询
+BIGINT_MAX = 2 ** 63 - 1
+
+class LowerBoundCount(int):
+    """只数到上限时的结果数，显示为 N+"""
+
+    def __str__(self):
+        return f"{int(self)}+"
+
+class EstimatedCountPaginator(Paginator):
+    """
+    大表分页器：避免对整表执行 COUNT(*)
+
+    未过滤的查询在 PostgreSQL 上直接读取 pg_class 中的估算行数；
+    其他情况只数到当前页之后 LOOKAHEAD_PAGES 页为止，超出时显示为 "N+"，
+    翻页时窗口随之后移，因此任何一页都可以到达。
+    """
+    ESTIMATE_THRESHOLD = 10000
+    LOOKAHEAD_PAGES = 10
+
+    def __init__(self, object_list, per_page, *args, current_page=1, **kwargs):
+        super().__init__(object_list, per_page, *args, **kwargs)
+        self.current_page = current_page
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = self._estimated_count(queryset)
+            if estimate is not None:
+                return estimate
+        limit = (self.current_page + self.LOOKAHEAD_PAGES) * self.per_page
+        count = queryset.order_by().values('pk')[:limit + 1].count()
+        if count > limit:
+            return LowerBoundCount(limit)
+        return count
+
+    def _estimated_count(self, queryset):
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE relname = %s",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples 为 -1 表示表尚未 ANALYZE
+        if not row or row[0] < self.ESTIMATE_THRESHOLD:
+            return None
+        return int(row[0])
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    大表通用配置：估算分页、不计算全表总数，搜索只走有索引的列
+
+    搜索词为 UUID 时按 uuid_search_fields 精确匹配，否则按 text_search_fields 中
+    区分大小写的 lookup 匹配（如 name__startswith），以便使用普通 B-tree / _like 索引；
+    搜索词为 64 位范围内的整数时，同时按 int_search_fields 精确匹配。
+    search_fields 仅用于显示搜索框和启用自动补全。
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    uuid_search_fields = []
+    int_search_fields = []
+    text_search_fields = []
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        try:
+            current_page = max(int(request.GET.get(PAGE_VAR, 1)), 1)
+        except ValueError:
+            current_page = 1
+        return self.paginator(queryset, per_page, orphans, allow_empty_first_page, current_page=current_page)
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        try:
+            query = self._lookup_query(self.uuid_search_fields, uuid.UUID(term))
+        except ValueError:
+            # 纯数字也可能是名称，整数 lookup 与文本 lookup 一并匹配
+            query = self._lookup_query(self.text_search_fields, term)
+            if term.isdigit() and int(term) <= BIGINT_MAX:
+                query |= self._lookup_query(self.int_search_fields, int(term))
+        if not query:
+            return queryset.none(), False
+        return queryset.filter(query), False
+
+    def _lookup_query(self, lookups, value):
+        query = Q()
+        for field in lookups:
+            query |= Q(**{field: value})
+        return query
+
+def _pretty_json(value):
+    """将状态渲染为只读的格式化 JSON"""
+    return format_html('<pre>{}</pre>', json.dumps(value, ensure_ascii=False, indent=2, sort_keys=True))
+
 @admin.register(Game)
-class GameAdmin(admin.ModelAdmin):
-    list_display = ['id','name', 'status', 'current_player', 'created_at', 'updated_at']
+class GameAdmin(LargeTableAdmin):
+    list_display = ['id', 'name', 'status', 'current_player', 'created_at', 'updated_at', 'related_links']
     list_filter = ['status', 'created_at', 'updated_at']
-    search_fields = ['id', 'name']
-    readonly_fields = ['id', 'created_at', 'updated_at']
+    list_select_related = ['current_player']
+    search_fields = ['name']
+    uuid_search_fields = ['id']
+    text_search_fields = ['name__startswith']
+    autocomplete_fields = ['host', 'current_player']
+    exclude = ['_game_state']
+    # 结束游戏须经 finish_game 结算统计，后台不能直接修改状态/获胜者
+    readonly_fields = [
+        'id', 'created_at', 'updated_at', 'status', 'winner', 'finished_at',
+        'card_dataset_version', 'game_state_display', 'recent_logs_display',
+    ]
+    recent_logs_count = 20
+
+    @admin.display(description="游戏状态")
+    def game_state_display(self, obj):
+        return _pretty_json(obj.game_state)
+
+    @admin.display(description="最近日志")
+    def recent_logs_display(self, obj):
+        """只显示最近若干条日志，完整日志见过滤后的日志列表"""
+        logs = obj.logs.select_related('player__user').order_by('-created_at')[:self.recent_logs_count]
+        return format_html(
+            '<ul>{}</ul><a href="{}?game__exact={}">全部日志</a>',
+            format_html_join('', '<li>{} {}: {}</li>', (
+                (log.created_at, log.player.user.username, log.action) for log in logs
+            )),
+            reverse('admin:games_gamelog_changelist'), obj.pk,
+        )
+
+    @admin.display(description="关联")
+    def related_links(self, obj):
+        """按外键过滤的玩家/日志列表链接，替代渲染全部游戏的侧边过滤器"""
+        return format_html(
+            '<a href="{}?game__exact={}">玩家</a> / <a href="{}?game__exact={}">日志</a>',
+            reverse('admin:games_player_changelist'), obj.pk,
+            reverse('admin:games_gamelog_changelist'), obj.pk,
+        )
 
 @admin.register(Player)
-class PlayerAdmin(admin.ModelAdmin):
-    list_display = ['id', 'game', 'user', 'score']
-    list_filter = ['game', 'score']
-    search_fields = ['id', 'game', 'user']
-    readonly_fields = ['id']
+class PlayerAdmin(LargeTableAdmin):
+    list_display = ['id', 'game', 'user', 'score', 'is_winner']
+    list_filter = ['is_winner']
+    list_select_related = ['game', 'user']
+    search_fields = ['user__username']
+    uuid_search_fields = ['game']
+    int_search_fields = ['id', 'user']
+    text_search_fields = ['user__username__exact']
+    raw_id_fields = ['game']
+    autocomplete_fields = ['user']
+    exclude = ['_player_state']
+    readonly_fields = ['id', 'player_state_display']
+
+    @admin.display(description="玩家状态")
+    def player_state_display(self, obj):
+        return _pretty_json(obj.player_state)
 
 @admin.register(Card)
 class CardAdmin(admin.ModelAdmin):
-    list_display = ['id', 'level', 'color', 'points', 'cost']
+    list_display = ['code', 'level', 'color', 'points', 'cost']
     list_filter = ['level', 'color', 'points']
-    search_fields = ['id', 'level', 'color']
+    search_fields = ['code']
     readonly_fields = ['id']
 
 @admin.register(Noble)
 class NobleAdmin(admin.ModelAdmin):
-    list_display = ['id', 'name', 'points', 'requirement']
+    list_display = ['code', 'name', 'points', 'requirement']
     list_filter = ['points']
-    search_fields = ['id', 'name']
+    search_fields = ['code', 'name']
     readonly_fields = ['id']
 
 @admin.register(GameLog)
-class GameLogAdmin(admin.ModelAdmin):
+class GameLogAdmin(LargeTableAdmin):
     list_display = ['id', 'game', 'player', 'action', 'created_at']
-    list_filter = ['game', 'player', 'created_at']
-    search_fields = ['id', 'game', 'player']
-    readonly_fields = ['id', 'created_at']
\ No newline at end of file
+    list_filter = ['created_at']
+    list_select_related = ['game', 'player__user', 'player__game']
+    search_fields = ['action']
+    uuid_search_fields = ['game']
+    int_search_fields = ['id', 'player']
+    text_search_fields = ['action__startswith']
+    raw_id_fields = ['game', 'player']
+    readonly_fields = ['id', 'game', 'player', 'action', 'created_at']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+@admin.register(PlayerStats)
+class PlayerStatsAdmin(LargeTableAdmin):
+    list_display = ['user', 'games_played', 'games_won', 'total_score', 'rating', 'updated_at']
+    list_select_related = ['user']
+    search_fields = ['user__username']
+    int_search_fields = ['user']
+    text_search_fields = ['user__username__exact']
+    raw_id_fields = ['user']
+    readonly_fields = ['updated_at']
\ No newline at end of file
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class GamesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'games'
+
+    def ready(self):
+        # 启动时校验卡牌数据集，数据有误时尽早失败
+        from .card_data import get_catalog
+        get_catalog()
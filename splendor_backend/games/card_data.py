@@ -0,0 +1,158 @@
+# games/card_data.py
+"""
+卡牌数据集：从 cards.json 读取、规范化并校验卡牌与贵族
+
+cards.json 中的数字均为字符串、颜色为大写，这里统一转换为 int 和
+Card.COLOR_CHOICES 使用的小写颜色。数据集的 sha256 作为版本号随每局游戏保存。
+"""
+import hashlib
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+
+CARDS_FILE = Path(__file__).resolve().parent / 'cards.json'
+
+GEM_COLORS = ('white', 'blue', 'green', 'red', 'black')
+
+# 每个等级的卡牌数量（标准 Splendor 规则）
+CARDS_PER_LEVEL = {1: 40, 2: 30, 3: 20}
+NOBLE_COUNT = 10
+
+
+class CardCatalog:
+    """已校验的卡牌数据集"""
+
+    def __init__(self, version, cards, nobles):
+        self.version = version
+        self.cards = cards
+        self.nobles = nobles
+
+    def cards_by_level(self, level):
+        return [card for card in self.cards if card['level'] == level]
+
+
+def _integer(value, where, name, minimum):
+    """
+    将 '4' / 4 形式的数字转换为 int
+
+    不接受布尔值、带小数的数字和小于 minimum 的值，避免 int() 的静默截断。
+    """
+    if isinstance(value, str) and re.fullmatch(r'-?\d+', value):
+        number = int(value)
+    elif isinstance(value, int) and not isinstance(value, bool):
+        number = value
+    elif isinstance(value, float) and value.is_integer():
+        number = int(value)
+    else:
+        raise ImproperlyConfigured(f"{where}: {name} {value!r} 不是整数")
+    if number < minimum:
+        raise ImproperlyConfigured(f"{where}: {name} 不能小于 {minimum}")
+    return number
+
+
+def _cost(raw, where):
+    """将 {'GREEN': '4'} 形式的花费转换为 {'green': 4}"""
+    if not isinstance(raw, dict) or not raw:
+        raise ImproperlyConfigured(f"{where}: price 必须是非空对象")
+    cost = {}
+    for color, amount in raw.items():
+        color = str(color).lower()
+        if color not in GEM_COLORS:
+            raise ImproperlyConfigured(f"{where}: 未知颜色 {color!r}")
+        cost[color] = _integer(amount, where, "数量", minimum=1)
+    return cost
+
+
+def _expect(value, kind, where):
+    """检查 JSON 节点类型，不符合时抛出 ImproperlyConfigured"""
+    if not isinstance(value, kind):
+        expected = "对象" if kind is dict else "数组"
+        raise ImproperlyConfigured(f"{where}: 应为{expected}，实际为 {type(value).__name__}")
+    return value
+
+
+def _level(level_key):
+    """将 'level1' 形式的键转换为等级"""
+    try:
+        level = int(level_key.removeprefix('level'))
+    except ValueError:
+        level = None
+    if level not in CARDS_PER_LEVEL:
+        raise ImproperlyConfigured(f"未知卡牌等级 {level_key!r}")
+    return level
+
+
+def _code(prefix, cost):
+    """由卡牌内容生成稳定编号，用于数据库 upsert"""
+    return prefix + ':' + ','.join(f"{color}{cost[color]}" for color in GEM_COLORS if color in cost)
+
+
+def parse_catalog(raw_bytes):
+    """解析并校验数据集内容，失败时抛出 ImproperlyConfigured"""
+    version = hashlib.sha256(raw_bytes).hexdigest()
+    try:
+        data = json.loads(raw_bytes)
+    except ValueError as exc:
+        raise ImproperlyConfigured(f"cards.json 不是合法的 JSON: {exc}")
+
+    _expect(data, dict, "cards.json")
+
+    cards = []
+    for section_index, section in enumerate(_expect(data.get('deck', []), list, "deck")):
+        for level_key, entries in _expect(section, dict, f"deck[{section_index}]").items():
+            level = _level(level_key)
+            for index, entry in enumerate(_expect(entries, list, level_key)):
+                where = f"{level_key}[{index}]"
+                _expect(entry, dict, where)
+                color = str(entry.get('color', '')).lower()
+                if color not in GEM_COLORS:
+                    raise ImproperlyConfigured(f"{where}: 未知颜色 {color!r}")
+                if 'score' not in entry:
+                    raise ImproperlyConfigured(f"{where}: 缺少 score")
+                points = _integer(entry['score'], where, "score", minimum=0)
+                cost = _cost(entry.get('price'), where)
+                cards.append({
+                    'code': _code(f"{level}:{color}:{points}", cost),
+                    'level': level,
+                    'color': color,
+                    'points': points,
+                    'cost': cost,
+                })
+
+    for level, expected in CARDS_PER_LEVEL.items():
+        count = sum(1 for card in cards if card['level'] == level)
+        if count != expected:
+            raise ImproperlyConfigured(f"{level} 级卡牌应为 {expected} 张，实际为 {count} 张")
+
+    nobles = []
+    for index, entry in enumerate(_expect(data.get('noble', []), list, "noble")):
+        where = f"noble[{index}]"
+        requirement = _cost(_expect(entry, dict, where).get('price'), where)
+        nobles.append({
+            'code': _code('noble', requirement),
+            'name': f"贵族{index + 1}",
+            'points': 3,
+            'requirement': requirement,
+        })
+    if len(nobles) != NOBLE_COUNT:
+        raise ImproperlyConfigured(f"贵族应为 {NOBLE_COUNT} 张，实际为 {len(nobles)} 张")
+
+    for items, kind in ((cards, "卡牌"), (nobles, "贵族")):
+        codes = [item['code'] for item in items]
+        if len(set(codes)) != len(codes):
+            raise ImproperlyConfigured(f"数据集中存在重复的{kind}")
+
+    return CardCatalog(version, cards, nobles)
+
+
+@lru_cache(maxsize=None)
+def get_catalog():
+    """
+    获取卡牌数据集（进程内只解析一次）
+
+    数据集只有百余条记录，解析加校验远低于 1 毫秒，无需额外的序列化缓存文件。
+    """
+    return parse_catalog(CARDS_FILE.read_bytes())
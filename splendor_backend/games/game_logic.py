@@ -1,6 +1,8 @@
 # games/game_logic.py
 import random
 from .models import Game, Player, Card, Noble
+from .stats import finish_game
+from .card_data import get_catalog
 
 class GameEngine:
     """处理Splendor游戏的核心逻辑"""
@@ -24,7 +26,8 @@ class GameEngine:
         token_count = 7 if player_count > 2 else 5
         gold_count = 5
         
-        # 初始化游戏状态
+        # 初始化游戏状态，记录所用数据集版本，数据集更新后进行中的游戏不受影响
+        self.game.card_dataset_version = get_catalog().version
         self.game.game_state = {
             'tokens': {
                 'white': token_count,
@@ -50,27 +53,19 @@ class GameEngine:
         self.game.save()
     
     def _initialize_cards(self):
-        """初始化卡牌"""
-        # 这里应该从数据库或预定义的卡牌集中获取卡牌
-        # 为简化示例，这里使用随机生成
-        # 实际应用中，您应该使用真实的Splendor卡牌数据
-        
-        # 返回初始化的卡牌结构
-        return {
-            'level1_deck': [],  # 这里应该是实际的卡牌数据
-            'level2_deck': [],
-            'level3_deck': [],
-            'board': {
-                'level1': [],
-                'level2': [],
-                'level3': []
-            }
-        }
+        """初始化卡牌：各等级洗牌后翻开4张，其余作为牌堆"""
+        catalog = get_catalog()
+        cards = {'board': {}}
+        for level in (1, 2, 3):
+            deck = catalog.cards_by_level(level)
+            random.shuffle(deck)
+            cards['board'][f'level{level}'] = deck[:4]
+            cards[f'level{level}_deck'] = deck[4:]
+        return cards
     
     def _initialize_nobles(self, count):
         """初始化贵族卡牌"""
-        # 同样，这里应该使用实际的贵族卡牌数据
-        return []
+        return random.sample(get_catalog().nobles, count)
     
     # 其他游戏逻辑方法，如拿取代币、购买卡牌、预留卡牌等
     def take_tokens(self, user, tokens):
@@ -88,6 +83,11 @@ class GameEngine:
         # 实现卡牌预留规则
         pass
     
+    def end_game(self, winner):
+        """结束游戏，并在同一事务中结算玩家统计"""
+        self.game = finish_game(self.game, winner)
+        return self.game
+
     def next_turn(self):
         """处理回合结束，进入下一玩家回合"""
         # 实现回合逻辑
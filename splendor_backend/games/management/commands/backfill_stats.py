@@ -0,0 +1,74 @@
+# games/management/commands/backfill_stats.py
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models.functions import Coalesce
+
+from games.models import Game, Player, PlayerStats
+from games.stats import apply_game_result
+
+
+class Command(BaseCommand):
+    help = (
+        "根据历史对局重新计算所有玩家的统计与等级分。"
+        "整个回放在一个事务中进行。PostgreSQL 上会锁住统计表，期间结束的游戏会等待回放提交后再结算；"
+        "其他数据库请在停止对局结算后执行。"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="每批读取/写入的行数")
+
+    def handle(self, *args, batch_size, **options):
+        stats_by_user = {}
+        game_count = 0
+
+        with transaction.atomic():
+            self._lock_stats_table()
+
+            # 按结束时间顺序回放，等级分依赖对局先后；
+            # 早于 finished_at 字段结束的游戏没有该值，以 updated_at 近似
+            games = (
+                Game.objects.filter(status=Game.FINISHED)
+                .order_by(Coalesce('finished_at', 'updated_at'), 'id')
+                .values_list('id', flat=True)
+            )
+            batch = []
+            for game_id in games.iterator(chunk_size=batch_size):
+                batch.append(game_id)
+                if len(batch) >= batch_size:
+                    game_count += self._replay(batch, stats_by_user)
+                    batch = []
+            if batch:
+                game_count += self._replay(batch, stats_by_user)
+
+            PlayerStats.objects.all().delete()
+            PlayerStats.objects.bulk_create(stats_by_user.values(), batch_size=batch_size)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"已回放 {game_count} 局游戏，更新 {len(stats_by_user)} 名玩家的统计"
+        ))
+
+    def _lock_stats_table(self):
+        """
+        阻止回放期间的并发结算写入统计表
+
+        PostgreSQL 上显式加 EXCLUSIVE 锁（不影响读取）；其他数据库只依赖事务隔离，
+        应在停止对局结算后执行。
+        """
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(f"LOCK TABLE {PlayerStats._meta.db_table} IN EXCLUSIVE MODE")
+
+    def _replay(self, game_ids, stats_by_user):
+        """回放一批对局，结果累加到 stats_by_user"""
+        results_by_game = {game_id: [] for game_id in game_ids}
+        rows = Player.objects.filter(game_id__in=game_ids).values_list('game_id', 'user_id', 'score', 'is_winner')
+        for game_id, user_id, score, is_winner in rows:
+            results_by_game[game_id].append({'user_id': user_id, 'score': score, 'is_winner': is_winner})
+
+        for game_id in game_ids:
+            results = results_by_game[game_id]
+            for r in results:
+                if r['user_id'] not in stats_by_user:
+                    stats_by_user[r['user_id']] = PlayerStats(user_id=r['user_id'])
+            apply_game_result(stats_by_user, results)
+        return len(game_ids)
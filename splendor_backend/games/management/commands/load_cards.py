@@ -0,0 +1,44 @@
+# games/management/commands/load_cards.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from games.card_data import get_catalog
+from games.models import Card, Noble
+
+
+class Command(BaseCommand):
+    help = "将 cards.json 中的卡牌与贵族写入数据库（可重复执行）"
+
+    def handle(self, *args, **options):
+        catalog = get_catalog()
+
+        cards = []
+        for data in catalog.cards:
+            card = Card(code=data['code'], level=data['level'], color=data['color'], points=data['points'])
+            card.cost = data['cost']
+            cards.append(card)
+        nobles = [
+            Noble(code=data['code'], name=data['name'], points=data['points'], requirement=data['requirement'])
+            for data in catalog.nobles
+        ]
+
+        with transaction.atomic():
+            Card.objects.bulk_create(
+                cards,
+                update_conflicts=True,
+                unique_fields=['code'],
+                update_fields=['level', 'color', 'points', '_cost'],
+            )
+            Noble.objects.bulk_create(
+                nobles,
+                update_conflicts=True,
+                unique_fields=['code'],
+                update_fields=['name', 'points', 'requirement'],
+            )
+            # 删除数据集中已不存在的记录，保证数据库与文件一致
+            Card.objects.exclude(code__in=[card.code for card in cards]).delete()
+            Noble.objects.exclude(code__in=[noble.code for noble in nobles]).delete()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"已载入 {len(cards)} 张卡牌、{len(nobles)} 张贵族（数据集版本 {catalog.version[:12]}）"
+        ))
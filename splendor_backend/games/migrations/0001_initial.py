@@ -0,0 +1,99 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:49
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Card',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('level', models.PositiveSmallIntegerField(choices=[(1, '一级'), (2, '二级'), (3, '三级')], verbose_name='等级')),
+                ('color', models.CharField(choices=[('white', '钻石'), ('blue', '蓝宝石'), ('green', '绿翡翠'), ('red', '红宝石'), ('black', '黑宝石'), ('gold', '金币')], max_length=10, verbose_name='颜色')),
+                ('points', models.PositiveSmallIntegerField(verbose_name='分数')),
+                ('_cost', models.JSONField(verbose_name='花费')),
+            ],
+            options={
+                'verbose_name': '卡牌',
+                'verbose_name_plural': '卡牌',
+            },
+        ),
+        migrations.CreateModel(
+            name='Noble',
+            fields=[
+                ('name', models.CharField(max_length=100, verbose_name='贵族名称')),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('points', models.PositiveSmallIntegerField(verbose_name='分数')),
+                ('requirement', models.JSONField(default=dict, verbose_name='需求')),
+            ],
+            options={
+                'verbose_name': '贵族',
+                'verbose_name_plural': '贵族',
+            },
+        ),
+        migrations.CreateModel(
+            name='Game',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100, verbose_name='游戏名称')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='创建时间')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='更新时间')),
+                ('status', models.CharField(choices=[('waiting', '等待玩家加入'), ('playing', '游戏进行中'), ('finished', '游戏已结束')], default='waiting', max_length=20, verbose_name='游戏状态')),
+                ('_game_state', models.TextField(blank=True, null=True, verbose_name='游戏状态JSON')),
+                ('min_players', models.PositiveSmallIntegerField(default=2, verbose_name='最少玩家数')),
+                ('max_players', models.PositiveSmallIntegerField(default=4, verbose_name='最多玩家数')),
+                ('current_player', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='turn_games', to=settings.AUTH_USER_MODEL, verbose_name='当前玩家')),
+                ('host', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hosted_games', to=settings.AUTH_USER_MODEL, verbose_name='房主')),
+                ('winner', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='won_games', to=settings.AUTH_USER_MODEL, verbose_name='获胜者')),
+            ],
+            options={
+                'verbose_name': '游戏',
+                'verbose_name_plural': '游戏',
+            },
+        ),
+        migrations.CreateModel(
+            name='Player',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.PositiveIntegerField(default=0, verbose_name='分数')),
+                ('order', models.PositiveSmallIntegerField(verbose_name='玩家顺序')),
+                ('is_current', models.BooleanField(default=False, verbose_name='是否当前玩家')),
+                ('is_winner', models.BooleanField(default=False, verbose_name='是否获胜者')),
+                ('joined_at', models.DateTimeField(auto_now_add=True, verbose_name='加入时间')),
+                ('_player_state', models.JSONField(blank=True, null=True, verbose_name='玩家状态')),
+                ('game', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='players', to='games.game', verbose_name='游戏')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='players', to=settings.AUTH_USER_MODEL, verbose_name='用户')),
+            ],
+            options={
+                'verbose_name': '玩家',
+                'verbose_name_plural': '玩家',
+                'ordering': ['order'],
+            },
+        ),
+        migrations.CreateModel(
+            name='GameLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action', models.CharField(max_length=100, verbose_name='动作')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='创建时间')),
+                ('game', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='logs', to='games.game', verbose_name='游戏')),
+                ('player', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='logs', to='games.player', verbose_name='玩家')),
+            ],
+            options={
+                'verbose_name': '游戏日志',
+                'verbose_name_plural': '游戏日志',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
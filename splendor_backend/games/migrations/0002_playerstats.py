@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('games_played', models.PositiveIntegerField(default=0, verbose_name='对局数')),
+                ('games_won', models.PositiveIntegerField(default=0, verbose_name='胜局数')),
+                ('total_score', models.PositiveIntegerField(default=0, verbose_name='总分')),
+                ('rating', models.FloatField(db_index=True, default=1500.0, verbose_name='等级分')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='更新时间')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to=settings.AUTH_USER_MODEL, verbose_name='用户')),
+            ],
+            options={
+                'verbose_name': '玩家统计',
+                'verbose_name_plural': '玩家统计',
+                'ordering': ['-rating', 'user_id'],
+            },
+        ),
+    ]
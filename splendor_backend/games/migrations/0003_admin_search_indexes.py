@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0002_playerstats'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='game',
+            name='name',
+            field=models.CharField(db_index=True, max_length=100, verbose_name='游戏名称'),
+        ),
+        migrations.AlterField(
+            model_name='gamelog',
+            name='action',
+            field=models.CharField(db_index=True, max_length=100, verbose_name='动作'),
+        ),
+        migrations.AlterField(
+            model_name='gamelog',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='创建时间'),
+        ),
+    ]
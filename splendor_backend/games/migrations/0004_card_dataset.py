@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:52
+
+from django.db import migrations, models
+
+
+def clear_cards(apps, schema_editor):
+    # 旧的卡牌/贵族记录没有对应的数据集编号，清空后由 load_cards 重新载入
+    apps.get_model('games', 'Card').objects.all().delete()
+    apps.get_model('games', 'Noble').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0003_admin_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_cards, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='card',
+            name='code',
+            field=models.CharField(default='', max_length=64, verbose_name='编号'),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='card',
+            name='code',
+            field=models.CharField(max_length=64, unique=True, verbose_name='编号'),
+        ),
+        migrations.AddField(
+            model_name='noble',
+            name='code',
+            field=models.CharField(default='', max_length=64, verbose_name='编号'),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='noble',
+            name='code',
+            field=models.CharField(max_length=64, unique=True, verbose_name='编号'),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='card_dataset_version',
+            field=models.CharField(blank=True, default='', max_length=64, verbose_name='卡牌数据集版本'),
+        ),
+    ]
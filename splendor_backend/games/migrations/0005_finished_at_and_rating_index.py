@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0004_card_dataset'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='finished_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='结束时间'),
+        ),
+        migrations.AlterField(
+            model_name='playerstats',
+            name='rating',
+            field=models.FloatField(default=1500.0, verbose_name='等级分'),
+        ),
+        migrations.AddIndex(
+            model_name='playerstats',
+            index=models.Index(fields=['-rating', 'user'], name='games_stats_rating_idx'),
+        ),
+    ]
@@ -17,9 +17,10 @@ class Game(models.Model):
     ]
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    name = models.CharField(max_length=100, verbose_name="游戏名称")
+    name = models.CharField(max_length=100, db_index=True, verbose_name="游戏名称")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="创建时间")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="更新时间")
+    finished_at = models.DateTimeField(null=True, blank=True, db_index=True, verbose_name="结束时间")
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=WAITING, verbose_name="游戏状态")
     host = models.ForeignKey(User, on_delete=models.CASCADE, related_name='hosted_games', verbose_name="房主")
     current_player = models.ForeignKey(
@@ -40,6 +41,7 @@ class Game(models.Model):
     )
 
     _game_state = models.TextField(blank=True, null=True, verbose_name="游戏状态JSON")
+    card_dataset_version = models.CharField(max_length=64, blank=True, default='', verbose_name="卡牌数据集版本")
 
     min_players = models.PositiveSmallIntegerField(default=2, verbose_name="最少玩家数")
     max_players = models.PositiveSmallIntegerField(default=4, verbose_name="最多玩家数")
@@ -141,6 +143,7 @@ class Card(models.Model):
     ]
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    code = models.CharField(max_length=64, unique=True, verbose_name="编号")
     level = models.PositiveSmallIntegerField(choices=LEVEL_CHOICES, verbose_name="等级")
     color = models.CharField(max_length=10, choices=COLOR_CHOICES, verbose_name="颜色")
     points = models.PositiveSmallIntegerField(verbose_name="分数")
@@ -166,6 +169,7 @@ class Noble(models.Model):
     """Noble model"""
     name = models.CharField(max_length=100, verbose_name="贵族名称")
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    code = models.CharField(max_length=64, unique=True, verbose_name="编号")
     points = models.PositiveSmallIntegerField(verbose_name="分数")
     requirement = models.JSONField(verbose_name="需求", default=dict)
 
@@ -182,8 +186,8 @@ class GameLog(models.Model):
     """GameLog model"""
     game = models.ForeignKey(Game, on_delete=models.CASCADE, related_name='logs', verbose_name="游戏")
     player = models.ForeignKey(Player, on_delete=models.CASCADE, related_name='logs', verbose_name="玩家")
-    action = models.CharField(max_length=100, verbose_name="动作")
-    created_at = models.DateTimeField(auto_now_add=True, verbose_name="创建时间")
+    action = models.CharField(max_length=100, db_index=True, verbose_name="动作")
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True, verbose_name="创建时间")
 
 
     class Meta:
@@ -192,4 +196,42 @@ class GameLog(models.Model):
         ordering = ['-created_at']
     
     def __str__(self):
-        return f"{self.action} ({self.created_at})"
\ No newline at end of file
+        return f"{self.action} ({self.created_at})"
+
+class PlayerStats(models.Model):
+    """PlayerStats model"""
+    DEFAULT_RATING = 1500.0
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='stats', verbose_name="用户")
+    games_played = models.PositiveIntegerField(default=0, verbose_name="对局数")
+    games_won = models.PositiveIntegerField(default=0, verbose_name="胜局数")
+    total_score = models.PositiveIntegerField(default=0, verbose_name="总分")
+    rating = models.FloatField(default=DEFAULT_RATING, verbose_name="等级分")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="更新时间")
+
+    class Meta:
+        verbose_name = "玩家统计"
+        verbose_name_plural = "玩家统计"
+        ordering = ['-rating', 'user_id']
+        indexes = [models.Index(fields=['-rating', 'user'], name='games_stats_rating_idx')]
+
+    @property
+    def win_rate(self):
+        """
+        获取胜率
+        """
+        if not self.games_played:
+            return 0.0
+        return self.games_won / self.games_played
+
+    @property
+    def average_score(self):
+        """
+        获取场均分数
+        """
+        if not self.games_played:
+            return 0.0
+        return self.total_score / self.games_played
+
+    def __str__(self):
+        return f"{self.user.username} ({self.rating:.0f})"
@@ -1,7 +1,7 @@
 # games/serializers.py
 from rest_framework import serializers
 from django.contrib.auth.models import User
-from .models import Game, Player, Card, Noble, GameLog
+from .models import Game, Player, Card, Noble, GameLog, PlayerStats
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -19,13 +19,31 @@ class GameSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'name', 'created_at', 'updated_at', 'status', 
             'host', 'current_player', 'winner', 'game_state',
-            'min_players', 'max_players'
+            'min_players', 'max_players', 'card_dataset_version', 'finished_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        # 状态与获胜者只能由游戏逻辑修改，结束游戏须经 finish_game 结算统计
+        read_only_fields = ['id', 'created_at', 'updated_at', 'status', 'card_dataset_version', 'finished_at']
+
+    def validate(self, attrs):
+        """玩家人数须在 Splendor 规则允许的 2-4 人之间"""
+        min_players = attrs.get('min_players', getattr(self.instance, 'min_players', 2))
+        max_players = attrs.get('max_players', getattr(self.instance, 'max_players', 4))
+        if not 2 <= min_players <= max_players <= 4:
+            raise serializers.ValidationError("玩家人数须满足 2 <= 最少玩家数 <= 最多玩家数 <= 4")
+        return attrs
 
 class PlayerSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
     
     class Meta:
         model = Player
-        fields = ['id', 'user', 'game', 'score', 'order', 'is_current', 'is_winner', 'joined_at', 'player_state']
\ No newline at end of file
+        fields = ['id', 'user', 'game', 'score', 'order', 'is_current', 'is_winner', 'joined_at', 'player_state']
+
+class PlayerStatsSerializer(serializers.ModelSerializer):
+    user = UserSerializer(read_only=True)
+    win_rate = serializers.FloatField(read_only=True)
+    average_score = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = PlayerStats
+        fields = ['user', 'games_played', 'games_won', 'win_rate', 'total_score', 'average_score', 'rating', 'updated_at']
@@ -0,0 +1,118 @@
+# games/stats.py
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Game, PlayerStats
+
+# Elo 系数：多人对局时按对手数量平摊
+ELO_K_FACTOR = 32
+
+
+def _outcome(a, b):
+    """比较两名玩家的结果，返回 a 相对 b 的实际得分（1/0.5/0）"""
+    key_a = (a['is_winner'], a['score'])
+    key_b = (b['is_winner'], b['score'])
+    if key_a > key_b:
+        return 1.0
+    if key_a < key_b:
+        return 0.0
+    return 0.5
+
+
+def compute_rating_changes(results, ratings):
+    """
+    计算一局游戏后每个玩家的等级分变化
+
+    results: [{'user_id', 'score', 'is_winner'}, ...]
+    ratings: {user_id: 当前等级分}
+    返回 {user_id: 等级分变化}
+    """
+    if len(results) < 2:
+        return {r['user_id']: 0.0 for r in results}
+
+    k = ELO_K_FACTOR / (len(results) - 1)
+    changes = {}
+    for a in results:
+        rating_a = ratings[a['user_id']]
+        delta = 0.0
+        for b in results:
+            if a is b:
+                continue
+            expected = 1 / (1 + 10 ** ((ratings[b['user_id']] - rating_a) / 400))
+            delta += _outcome(a, b) - expected
+        changes[a['user_id']] = k * delta
+    return changes
+
+
+def apply_game_result(stats_by_user, results):
+    """
+    将一局游戏的结果累加到内存中的统计对象上（不写库）
+
+    stats_by_user: {user_id: PlayerStats}，需包含本局所有玩家
+    """
+    ratings = {r['user_id']: stats_by_user[r['user_id']].rating for r in results}
+    changes = compute_rating_changes(results, ratings)
+    for r in results:
+        stats = stats_by_user[r['user_id']]
+        stats.games_played += 1
+        stats.games_won += 1 if r['is_winner'] else 0
+        stats.total_score += r['score']
+        stats.rating += changes[r['user_id']]
+
+
+def game_results(game):
+    """提取一局游戏中每个玩家的结果"""
+    return [
+        {'user_id': p.user_id, 'score': p.score, 'is_winner': p.is_winner}
+        for p in game.players.all()
+    ]
+
+
+def record_game_result(game):
+    """
+    在调用方的事务中更新本局所有玩家的统计与等级分
+
+    必须在标记游戏为 FINISHED 的同一事务内调用，保证统计与对局结果一致。
+    """
+    results = game_results(game)
+    user_ids = [r['user_id'] for r in results]
+
+    for uid in user_ids:
+        PlayerStats.objects.get_or_create(user_id=uid)
+    # 按固定顺序加锁，避免并发结算时死锁
+    stats_by_user = {
+        s.user_id: s
+        for s in PlayerStats.objects.select_for_update().filter(user_id__in=user_ids).order_by('user_id')
+    }
+
+    apply_game_result(stats_by_user, results)
+    now = timezone.now()
+    for stats in stats_by_user.values():
+        stats.updated_at = now
+    PlayerStats.objects.bulk_update(
+        stats_by_user.values(),
+        ['games_played', 'games_won', 'total_score', 'rating', 'updated_at'],
+    )
+
+
+def finish_game(game, winner):
+    """
+    结束游戏：标记获胜者、更新状态为 FINISHED，并在同一事务中结算统计
+    """
+    with transaction.atomic():
+        game = Game.objects.select_for_update().get(pk=game.pk)
+        if game.status == Game.FINISHED:
+            return game
+        if not game.players.filter(user=winner).exists():
+            raise ValueError("获胜者不是此游戏的玩家")
+
+        game.players.update(is_current=False, is_winner=False)
+        game.players.filter(user=winner).update(is_winner=True)
+        game.status = Game.FINISHED
+        game.winner = winner
+        game.finished_at = timezone.now()
+        game.current_player = None
+        game.save()
+
+        record_game_result(game)
+    return game
@@ -1,3 +1,284 @@
+import json
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+
+from .admin import EstimatedCountPaginator, GameLogAdmin
+from .card_data import CARDS_FILE, get_catalog, parse_catalog
+from .models import Card, Game, GameLog, Noble, Player, PlayerStats
+from .serializers import GameSerializer
+from .stats import apply_game_result, compute_rating_changes, finish_game
 
 # Create your tests here.
+
+
+class RatingTests(TestCase):
+    def test_two_player_changes_are_zero_sum(self):
+        results = [
+            {'user_id': 1, 'score': 15, 'is_winner': True},
+            {'user_id': 2, 'score': 9, 'is_winner': False},
+        ]
+        changes = compute_rating_changes(results, {1: 1500.0, 2: 1620.0})
+        self.assertGreater(changes[1], 0)
+        self.assertAlmostEqual(changes[1] + changes[2], 0)
+
+    def test_single_player_rating_is_unchanged(self):
+        results = [{'user_id': 1, 'score': 15, 'is_winner': True}]
+        self.assertEqual(compute_rating_changes(results, {1: 1500.0}), {1: 0.0})
+
+
+class FinishGameTests(TestCase):
+    def setUp(self):
+        self.users = [User.objects.create_user(f'user{i}') for i in range(3)]
+
+    def _create_game(self, users, scores):
+        game = Game.objects.create(name='test', host=users[0], status=Game.PLAYING)
+        for order, (user, score) in enumerate(zip(users, scores)):
+            Player.objects.create(game=game, user=user, order=order, score=score)
+        return game
+
+    def test_finish_game_records_stats(self):
+        game = self._create_game(self.users[:2], [15, 9])
+        game = finish_game(game, self.users[0])
+
+        self.assertEqual(game.status, Game.FINISHED)
+        self.assertIsNotNone(game.finished_at)
+        winner_stats = PlayerStats.objects.get(user=self.users[0])
+        self.assertEqual((winner_stats.games_played, winner_stats.games_won, winner_stats.total_score), (1, 1, 15))
+        self.assertGreater(winner_stats.rating, PlayerStats.DEFAULT_RATING)
+
+    def test_finish_game_twice_records_once(self):
+        game = self._create_game(self.users[:2], [15, 9])
+        finish_game(game, self.users[0])
+        finish_game(game, self.users[1])
+
+        game.refresh_from_db()
+        self.assertEqual(game.winner, self.users[0])
+        self.assertEqual(PlayerStats.objects.get(user=self.users[1]).games_played, 1)
+
+    def test_finish_game_rejects_outside_winner(self):
+        game = self._create_game(self.users[:2], [15, 9])
+        with self.assertRaises(ValueError):
+            finish_game(game, self.users[2])
+
+        game.refresh_from_db()
+        self.assertEqual(game.status, Game.PLAYING)
+        self.assertFalse(PlayerStats.objects.exists())
+
+    def test_backfill_matches_incremental_stats(self):
+        finish_game(self._create_game(self.users, [15, 9, 12]), self.users[0])
+        finish_game(self._create_game(self.users[1:], [16, 7]), self.users[1])
+        finish_game(self._create_game(self.users[:2], [8, 15]), self.users[1])
+        incremental = {s.user_id: s for s in PlayerStats.objects.all()}
+
+        call_command('backfill_stats', batch_size=2, stdout=StringIO())
+
+        backfilled = {s.user_id: s for s in PlayerStats.objects.all()}
+        self.assertEqual(incremental.keys(), backfilled.keys())
+        for user_id, expected in incremental.items():
+            actual = backfilled[user_id]
+            self.assertEqual(
+                (actual.games_played, actual.games_won, actual.total_score),
+                (expected.games_played, expected.games_won, expected.total_score),
+            )
+            self.assertAlmostEqual(actual.rating, expected.rating)
+
+    def test_backfill_orders_unstamped_games_by_updated_at(self):
+        now = timezone.now()
+        stamped = finish_game(self._create_game(self.users[:2], [15, 9]), self.users[0])
+        Game.objects.filter(pk=stamped.pk).update(finished_at=now - timezone.timedelta(days=60))
+        # 早于 finished_at 字段结束的历史对局
+        unstamped = self._create_game(self.users[:2], [9, 15])
+        Player.objects.filter(game=unstamped, user=self.users[1]).update(is_winner=True)
+        Game.objects.filter(pk=unstamped.pk).update(
+            status=Game.FINISHED, winner=self.users[1], finished_at=None,
+            updated_at=now - timezone.timedelta(days=30),
+        )
+
+        expected = {user.pk: PlayerStats(user=user) for user in self.users[:2]}
+        for game in (stamped, unstamped):
+            apply_game_result(expected, [
+                {'user_id': p.user_id, 'score': p.score, 'is_winner': p.is_winner}
+                for p in Player.objects.filter(game=game)
+            ])
+
+        call_command('backfill_stats', stdout=StringIO())
+
+        for user_id, stats in expected.items():
+            self.assertAlmostEqual(PlayerStats.objects.get(user_id=user_id).rating, stats.rating)
+
+
+class LargeTableAdminTests(TestCase):
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(self.admin_user)
+        self.game = Game.objects.create(name='Ruby Rush', host=self.admin_user)
+        self.player = Player.objects.create(game=self.game, user=self.admin_user, order=0)
+        GameLog.objects.bulk_create(
+            GameLog(game=self.game, player=self.player, action=f'take_tokens {i}') for i in range(30)
+        )
+
+    def test_paginator_counts_exactly_below_window(self):
+        paginator = EstimatedCountPaginator(GameLog.objects.filter(game=self.game), 10, current_page=1)
+        self.assertEqual(paginator.count, 30)
+        self.assertEqual(str(paginator.count), '30')
+
+    def test_paginator_window_follows_current_page(self):
+        queryset = GameLog.objects.filter(game=self.game)
+        with mock.patch.object(EstimatedCountPaginator, 'LOOKAHEAD_PAGES', 1):
+            first = EstimatedCountPaginator(queryset, 5, current_page=1)
+            self.assertEqual(first.count, 10)
+            self.assertEqual(str(first.count), '10+')
+
+            later = EstimatedCountPaginator(queryset, 5, current_page=4)
+            self.assertEqual(later.count, 25)
+            self.assertEqual(len(later.page(4)), 5)
+
+    def test_changelist_shows_lower_bound_and_reaches_later_pages(self):
+        url = f'/admin/games/gamelog/?game__exact={self.game.pk}'
+        with mock.patch.object(GameLogAdmin, 'list_per_page', 5), \
+                mock.patch.object(EstimatedCountPaginator, 'LOOKAHEAD_PAGES', 1):
+            response = self.client.get(url)
+            self.assertContains(response, '10+')
+
+            response = self.client.get(url + '&p=6')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.context['cl'].result_list), 5)
+
+    def test_search_matches_prefix_or_key(self):
+        response = self.client.get('/admin/games/game/', {'q': 'Ruby'})
+        self.assertEqual(response.context['cl'].result_count, 1)
+        response = self.client.get('/admin/games/game/', {'q': 'Rush'})
+        self.assertEqual(response.context['cl'].result_count, 0)
+        response = self.client.get('/admin/games/game/', {'q': str(self.game.pk)})
+        self.assertEqual(response.context['cl'].result_count, 1)
+
+    def test_digit_search_also_matches_text(self):
+        game = Game.objects.create(name='2048', host=self.admin_user)
+        response = self.client.get('/admin/games/game/', {'q': '2048'})
+        self.assertEqual(list(response.context['cl'].result_list), [game])
+
+        user = User.objects.create_user('12345')
+        Player.objects.create(game=game, user=user, order=0)
+        response = self.client.get('/admin/games/player/', {'q': '12345'})
+        self.assertEqual([player.user for player in response.context['cl'].result_list], [user])
+
+    def test_search_ignores_out_of_range_integers(self):
+        response = self.client.get('/admin/games/player/', {'q': '9' * 30})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['cl'].result_count, 0)
+
+    def test_admin_cannot_finish_game_directly(self):
+        response = self.client.get(f'/admin/games/game/{self.game.pk}/change/')
+        form = response.context['adminform'].form
+        for field in ('status', 'winner', 'finished_at'):
+            self.assertNotIn(field, form.fields)
+
+    def test_game_change_page_shows_recent_logs_only(self):
+        response = self.client.get(f'/admin/games/game/{self.game.pk}/change/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content.decode().count('take_tokens'), 20)
+
+
+class CardCatalogTests(TestCase):
+    def setUp(self):
+        self.data = json.loads(CARDS_FILE.read_bytes())
+
+    def _parse(self):
+        return parse_catalog(json.dumps(self.data).encode())
+
+    def test_bundled_dataset_is_valid(self):
+        catalog = get_catalog()
+        self.assertEqual(len(catalog.cards_by_level(1)), 40)
+        self.assertEqual(len(catalog.nobles), 10)
+        self.assertEqual(catalog.cards[0]['cost'], {'green': 4})
+
+    def test_rejects_wrong_card_count(self):
+        self.data['deck'][0]['level1'].pop()
+        with self.assertRaisesMessage(ImproperlyConfigured, "1 级卡牌应为 40 张"):
+            self._parse()
+
+    def test_rejects_unknown_colour(self):
+        self.data['deck'][0]['level1'][0]['color'] = 'PURPLE'
+        with self.assertRaisesMessage(ImproperlyConfigured, "未知颜色"):
+            self._parse()
+
+    def test_rejects_non_integer_amount(self):
+        self.data['noble'][0]['price']['GREEN'] = 'three'
+        with self.assertRaisesMessage(ImproperlyConfigured, "不是整数"):
+            self._parse()
+
+    def test_rejects_negative_score(self):
+        self.data['deck'][0]['level1'][0]['score'] = '-1'
+        with self.assertRaisesMessage(ImproperlyConfigured, "score 不能小于 0"):
+            self._parse()
+
+    def test_rejects_fractional_numbers(self):
+        self.data['deck'][0]['level1'][0]['score'] = 1.5
+        with self.assertRaisesMessage(ImproperlyConfigured, "不是整数"):
+            self._parse()
+
+        self.setUp()
+        self.data['deck'][0]['level1'][0]['price']['GREEN'] = '4.5'
+        with self.assertRaisesMessage(ImproperlyConfigured, "不是整数"):
+            self._parse()
+
+    def test_rejects_boolean_numbers(self):
+        self.data['deck'][0]['level1'][0]['score'] = True
+        with self.assertRaisesMessage(ImproperlyConfigured, "不是整数"):
+            self._parse()
+
+        self.setUp()
+        self.data['noble'][0]['price']['GREEN'] = True
+        with self.assertRaisesMessage(ImproperlyConfigured, "不是整数"):
+            self._parse()
+
+    def test_rejects_duplicate_cards(self):
+        level1 = self.data['deck'][0]['level1']
+        level1[1] = dict(level1[0])
+        with self.assertRaisesMessage(ImproperlyConfigured, "重复的卡牌"):
+            self._parse()
+
+    def test_rejects_malformed_structure(self):
+        self.data['deck'][0]['levelX'] = self.data['deck'][0].pop('level1')
+        with self.assertRaisesMessage(ImproperlyConfigured, "未知卡牌等级"):
+            self._parse()
+
+        self.setUp()
+        self.data['deck'][0]['level1'][0] = 'not a card'
+        with self.assertRaisesMessage(ImproperlyConfigured, "应为对象"):
+            self._parse()
+
+    def test_load_cards_is_idempotent(self):
+        call_command('load_cards', stdout=StringIO())
+        call_command('load_cards', stdout=StringIO())
+        self.assertEqual(Card.objects.count(), 90)
+        self.assertEqual(Noble.objects.count(), 10)
+
+
+class StartGameTests(TestCase):
+    def setUp(self):
+        self.users = [User.objects.create_user(f'user{i}') for i in range(2)]
+
+    def test_serializer_rejects_too_many_players(self):
+        serializer = GameSerializer(data={'name': 'big', 'max_players': 10})
+        self.assertFalse(serializer.is_valid())
+
+    def test_start_deals_cards_and_records_dataset_version(self):
+        game = Game.objects.create(name='test', host=self.users[0])
+        for order, user in enumerate(self.users):
+            Player.objects.create(game=game, user=user, order=order)
+
+        self.client.force_login(self.users[0])
+        response = self.client.post(f'/api/games/{game.pk}/start/')
+        self.assertEqual(response.status_code, 200)
+
+        game.refresh_from_db()
+        self.assertEqual(game.card_dataset_version, get_catalog().version)
+        self.assertEqual(len(game.game_state['cards']['board']['level1']), 4)
+        self.assertEqual(len(game.game_state['nobles']), 3)
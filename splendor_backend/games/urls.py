@@ -5,6 +5,7 @@ from . import views
 
 router = DefaultRouter()
 router.register(r'games', views.GameViewSet, basename='game')
+router.register(r'leaderboard', views.LeaderboardViewSet, basename='leaderboard')
 # 可以添加其他ViewSet，如PlayerViewSet等
 
 urlpatterns = [
@@ -2,11 +2,13 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.pagination import PageNumberPagination
 from django.db.models import Q
 from django.shortcuts import get_object_or_404
 
-from .models import Game, Player, Card, Noble, GameLog
-from .serializers import GameSerializer, PlayerSerializer
+from .models import Game, Player, Card, Noble, GameLog, PlayerStats
+from .serializers import GameSerializer, PlayerSerializer, PlayerStatsSerializer
+from .game_logic import GameEngine
 
 # 自定义权限类
 class IsHostOrReadOnly(permissions.BasePermission):
@@ -83,23 +85,23 @@ class GameViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # 这里应该调用游戏初始化逻辑
-        game.status = Game.PLAYING
-        game.current_player = game.players.all().order_by('order').first().user
+        GameEngine(game).initialize_game()
         
-        # 初始化游戏状态（这部分需要根据Splendor规则实现）
-        game_state = {
-            'tokens': {'white': 7, 'blue': 7, 'green': 7, 'red': 7, 'black': 7, 'gold': 5},
-            'cards': {
-                'level1_deck': [...],  # 初始卡牌
-                'level2_deck': [...],
-                'level3_deck': [...],
-                'board': {...}         # 展示的卡牌
-            },
-            'nobles': [...]            # 贵族卡牌
-        }
-        
-        game.game_state = game_state
-        game.save()
-        
-        return Response(GameSerializer(game).data)
\ No newline at end of file
+        return Response(GameSerializer(game).data)
+
+class LeaderboardPagination(PageNumberPagination):
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+
+class LeaderboardViewSet(viewsets.ReadOnlyModelViewSet):
+    """排行榜：按等级分降序分页返回玩家统计"""
+    serializer_class = PlayerStatsSerializer
+    pagination_class = LeaderboardPagination
+    permission_classes = [permissions.IsAuthenticated]
+    lookup_field = 'user_id'
+
+    def get_queryset(self):
+        """排序走 rating 索引，只 JOIN 用户表"""
+        return PlayerStats.objects.select_related('user').order_by('-rating', 'user_id')